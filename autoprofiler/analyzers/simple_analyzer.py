@@ -4,27 +4,185 @@ Deterministic analyzer that matches collector metrics against declarative patter
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Tuple
+import functools
+from collections import ChainMap
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from ..models import Finding, ProfileArtifact
 from .base import Analyzer
 
+try:  # numpy is optional; the analyzer falls back to pure Python without it
+    import numpy as _np
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
+
+# Comparison opcodes produced by _parse_rule. Rules are parsed once at
+# construction time so the per-artifact matching loop only dispatches on
+# small integers instead of re-parsing rule strings.
+_OP_GE = 0
+_OP_LE = 1
+_OP_GT = 2
+_OP_LT = 3
+_OP_EQ = 4
+
+# Source-level operator spelling per opcode, used by the matcher codegen.
+_OP_SYMBOLS = (">=", "<=", ">", "<", "==")
+
+# A generated matcher takes the merged metric view and returns the evidence
+# dict on match, or None.
+Matcher = Callable[[Dict[str, float]], Optional[Dict[str, float]]]
+
+
+def _parse_rule(rule: str) -> Tuple[int, float]:
+    """Compile a textual rule such as ``">= 75"`` into (opcode, threshold)."""
+
+    rule = rule.strip()
+    if rule.startswith(">="):
+        return _OP_GE, float(rule[2:])
+    if rule.startswith("<="):
+        return _OP_LE, float(rule[2:])
+    if rule.startswith(">"):
+        return _OP_GT, float(rule[1:])
+    if rule.startswith("<"):
+        return _OP_LT, float(rule[1:])
+    return _OP_EQ, float(rule)
+
+
+_NAN = float("nan")
+
+
+def _compile_matcher(
+    pattern_id: str, conditions: List[Tuple[str, int, float]]
+) -> Matcher:
+    """Generate a straight-line match function specialized for one pattern.
+
+    Patterns are a tiny DSL; instead of interpreting the condition list per
+    artifact, every pattern gets a function with its lookups, thresholds,
+    and comparisons inlined, compiled once via exec. Metric names are bound
+    as namespace constants so no quoting of user-provided keys is needed.
+    """
+
+    lines = ["def _match(m):"]
+    namespace: Dict[str, object] = {}
+    for index, (name, op, threshold) in enumerate(conditions):
+        namespace[f"_k{index}"] = name
+        lines.append(f"    v{index} = m.get(_k{index})")
+        lines.append(
+            f"    if v{index} is None or not (v{index} {_OP_SYMBOLS[op]} {threshold!r}):"
+        )
+        lines.append("        return None")
+    evidence = ", ".join(f"_k{i}: v{i}" for i in range(len(conditions)))
+    lines.append(f"    return {{{evidence}}}")
+
+    source = "\n".join(lines)
+    exec(compile(source, f"<pattern-matcher:{pattern_id}>", "exec"), namespace)
+    return namespace["_match"]  # type: ignore[return-value]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_conditions(
+    pattern_id: str, condition_items: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[Tuple[str, int, float], ...], Matcher]:
+    """Parse and codegen one pattern's conditions, cached across analyzers.
+
+    Repeated runs (tests, demo scripts) construct fresh analyzers from the
+    same YAML; keying on the structural condition content lets every
+    instance share the parsed tuples and the generated matcher.
+    """
+
+    conditions = tuple(
+        (name, *_parse_rule(rule)) for name, rule in condition_items
+    )
+    return conditions, _compile_matcher(pattern_id, list(conditions))
+
 
 class PatternMatchingAnalyzer(Analyzer):
     """Analyzer that evaluates numeric thresholds defined in patterns."""
 
     def __init__(self, patterns: List[Dict]) -> None:
         self.patterns = patterns
+        # 中英文注释: 规则在构造时编译一次, 热循环不再做字符串解析
+        # (rules compile once here; the hot loop never parses strings)
+        self._compiled: List[
+            Tuple[Dict, Tuple[Tuple[str, int, float], ...], Matcher]
+        ] = []
+        for pattern in patterns:
+            conditions, matcher = _compile_conditions(
+                str(pattern.get("id", "")),
+                tuple(pattern.get("condition", {}).items()),
+            )
+            self._compiled.append((pattern, conditions, matcher))
+        # Inverted index over condition metric names plus per-pattern
+        # required-key sets, so artifacts exposing only a few metrics skip
+        # unrelated patterns without invoking their matchers.
+        self._required: List[frozenset] = [
+            frozenset(name for name, _, _ in conditions)
+            for _, conditions, _ in self._compiled
+        ]
+        self._index: Dict[str, List[int]] = {}
+        for pattern_index, required in enumerate(self._required):
+            for name in required:
+                self._index.setdefault(name, []).append(pattern_index)
+        # Patterns partitioned by their optional 'category' field; patterns
+        # without one apply to every artifact.
+        self._by_category: Dict[Optional[str], List[int]] = {}
+        for pattern_index, (pattern, _, _) in enumerate(self._compiled):
+            self._by_category.setdefault(pattern.get("category"), []).append(
+                pattern_index
+            )
+        self._relevant_cache: Dict[Optional[str], List[int]] = {}
+        if _np is not None:
+            self._build_arrays()
+        # Merged metric views are pure per-artifact transforms, so they are
+        # memoized for repeated analyze() calls over the same session.
+        self._merged_cache: Dict[Tuple[str, str, str], Mapping[str, float]] = {}
+
+    def _build_arrays(self) -> None:
+        """Flatten compiled conditions into parallel NumPy arrays.
+
+        All conditions across all patterns are concatenated; ``_bounds``
+        records where each pattern's segment starts so a single
+        ``logical_and.reduceat`` yields per-pattern match booleans.
+        Patterns without conditions always match and are kept aside.
+        """
+
+        names: List[str] = []
+        ops: List[int] = []
+        thresholds: List[float] = []
+        bounds: List[int] = []
+        segmented: List[Tuple[int, Dict, Tuple[Tuple[str, int, float], ...]]] = []
+        self._unconditional: List[Tuple[int, Dict]] = []
+        for pattern_index, (pattern, conditions, _matcher) in enumerate(self._compiled):
+            if not conditions:
+                self._unconditional.append((pattern_index, pattern))
+                continue
+            bounds.append(len(names))
+            segmented.append((pattern_index, pattern, conditions))
+            for name, op, threshold in conditions:
+                names.append(name)
+                ops.append(op)
+                thresholds.append(threshold)
+
+        self._vector_names = names
+        self._vector_patterns = segmented
+        self._ops = _np.asarray(ops, dtype=_np.int8)
+        self._thresholds = _np.asarray(thresholds, dtype=_np.float64)
+        self._bounds = _np.asarray(bounds, dtype=_np.intp)
 
     def analyze(self, artifacts: Iterable[ProfileArtifact]) -> List[Finding]:
         findings: List[Finding] = []
-        artifact_list = list(artifacts)
-        for artifact_index, artifact in enumerate(artifact_list):
-            for pattern in self.patterns:
-                matches, evidence = self._matches_pattern(artifact.metrics, pattern)
-                if not matches:
-                    continue
-
+        # Iterate lazily; nothing below needs random access, so copying an
+        # already-materialized sequence would be pure overhead.
+        for artifact_index, artifact in enumerate(artifacts):
+            relevant = self._relevant_indices(artifact.category)
+            if not relevant:
+                continue
+            merged = self._merge_metrics(artifact)
+            if _np is not None:
+                matched = self._match_vectorized(merged, artifact.category)
+            else:
+                matched = self._match_scalar(merged, relevant)
+            for pattern, evidence in matched:
                 finding_id = f"finding_{artifact_index}_{pattern['id']}"
                 summary = pattern.get("meaning", "Pattern match detected")
                 suggestions = list(pattern.get("suggestions", []))
@@ -42,31 +200,130 @@ class PatternMatchingAnalyzer(Analyzer):
                 )
         return findings
 
-    def _matches_pattern(
-        self, metrics: Dict[str, float], pattern: Dict
-    ) -> Tuple[bool, Dict[str, float]]:
-        evidence: Dict[str, float] = {}
-        conditions: Dict[str, str] = pattern.get("condition", {})
-        for metric_name, rule in conditions.items():
-            if metric_name not in metrics:
-                return False, evidence
-            value = float(metrics[metric_name])
-            if not self._evaluate_rule(value, rule):
-                return False, evidence
-            evidence[metric_name] = value
-        return True, evidence
-
-    def _evaluate_rule(self, value: float, rule: str) -> bool:
-        rule = rule.strip()
-        if rule.startswith(">="):
-            return value >= float(rule[2:])
-        if rule.startswith("<="):
-            return value <= float(rule[2:])
-        if rule.startswith(">"):
-            return value > float(rule[1:])
-        if rule.startswith("<"):
-            return value < float(rule[1:])
-        return value == float(rule)
+    def _merge_metrics(self, artifact: ProfileArtifact) -> Mapping[str, float]:
+        """Build a float-coerced metric view with category-namespaced aliases.
+
+        Each numeric metric is reachable both as ``name`` and as
+        ``category.name`` so patterns can disambiguate collectors. The two
+        forms share one set of values through a ChainMap instead of a
+        doubled flat dict. Values that do not coerce to float (status
+        strings, nested structures) are dropped up front instead of failing
+        inside the matching loop. The result is cached per artifact
+        identity.
+        """
+
+        key = (artifact.collector, artifact.category, artifact.timestamp)
+        cached = self._merged_cache.get(key)
+        if cached is not None:
+            return cached
+
+        plain: Dict[str, float] = {}
+        for name, value in artifact.metrics.items():
+            try:
+                plain[name] = float(value)
+            except (TypeError, ValueError):
+                continue
+        namespaced = {f"{artifact.category}.{name}": value for name, value in plain.items()}
+        merged: Mapping[str, float] = ChainMap(namespaced, plain)
+        self._merged_cache[key] = merged
+        return merged
+
+    def _relevant_indices(self, category: str) -> List[int]:
+        """Pattern indices applicable to artifacts of the given category."""
+
+        cached = self._relevant_cache.get(category)
+        if cached is None:
+            cached = sorted(
+                self._by_category.get(None, []) + self._by_category.get(category, [])
+            )
+            self._relevant_cache[category] = cached
+        return cached
+
+    def _match_scalar(
+        self, metrics: Mapping[str, float], relevant: List[int]
+    ) -> List[Tuple[Dict, Dict[str, float]]]:
+        keys = metrics.keys()
+        candidates = {
+            pattern_index
+            for key in keys
+            for pattern_index in self._index.get(key, ())
+        }
+        matched: List[Tuple[Dict, Dict[str, float]]] = []
+        for pattern_index in relevant:
+            pattern, _conditions, matcher = self._compiled[pattern_index]
+            required = self._required[pattern_index]
+            if required:
+                # Skip patterns referencing no present metric, and those
+                # whose full key set the artifact cannot satisfy.
+                if pattern_index not in candidates or not required <= keys:
+                    continue
+            evidence = matcher(metrics)
+            if evidence is not None:
+                matched.append((pattern, evidence))
+        return matched
+
+    def _match_vectorized(
+        self, metrics: Mapping[str, float], category: str
+    ) -> List[Tuple[Dict, Dict[str, float]]]:
+        """Evaluate every condition of every pattern in a handful of vector ops.
+
+        Missing or non-numeric metrics become NaN, which compares False
+        under every opcode and therefore fails the condition, matching the
+        scalar path's "metric absent" behavior. Category filtering happens
+        after the batch evaluation, which is cheaper than re-slicing the
+        condition arrays per category. Matches carry their compiled pattern
+        index and are sorted by it before returning, so findings come out
+        in declaration order exactly like the scalar path.
+        """
+
+        matched: List[Tuple[int, Dict, Dict[str, float]]] = [
+            (pattern_index, pattern, {})
+            for pattern_index, pattern in self._unconditional
+            if pattern.get("category") in (None, category)
+        ]
+        if not self._vector_names:
+            matched.sort(key=lambda entry: entry[0])
+            return [(pattern, evidence) for _, pattern, evidence in matched]
+
+        # _merge_metrics already coerced every value to float, so missing
+        # keys are the only case left to map (to NaN, which fails every
+        # comparison just like the scalar path's None check).
+        values = _np.fromiter(
+            (metrics.get(name, _NAN) for name in self._vector_names),
+            dtype=_np.float64,
+            count=len(self._vector_names),
+        )
+        masks = _np.select(
+            [
+                self._ops == _OP_GE,
+                self._ops == _OP_LE,
+                self._ops == _OP_GT,
+                self._ops == _OP_LT,
+            ],
+            [
+                values >= self._thresholds,
+                values <= self._thresholds,
+                values > self._thresholds,
+                values < self._thresholds,
+            ],
+            default=values == self._thresholds,
+        )
+        pattern_matches = _np.logical_and.reduceat(masks, self._bounds)
+        for index, is_match in enumerate(pattern_matches):
+            if not is_match:
+                continue
+            pattern_index, pattern, conditions = self._vector_patterns[index]
+            pattern_category = pattern.get("category")
+            if pattern_category is not None and pattern_category != category:
+                continue
+            start = int(self._bounds[index])
+            evidence = {
+                name: float(values[start + offset])
+                for offset, (name, _, _) in enumerate(conditions)
+            }
+            matched.append((pattern_index, pattern, evidence))
+        matched.sort(key=lambda entry: entry[0])
+        return [(pattern, evidence) for _, pattern, evidence in matched]
 
     def _confidence(self, evidence: Dict[str, float]) -> float:
         # 中英文注释: 简单的置信度估计基于证据数量 (confidence derives from evidence breadth)
@@ -8,15 +8,21 @@ results are reproducible and can be re-analyzed later.
 
 from __future__ import annotations
 
+import heapq
+import marshal
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import pstats
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import ProfileArtifact
 from .base import Collector
 
+# pstats files are marshal-serialized dicts mapping
+# (filename, line, func) -> (cc, nc, tt, ct, callers).
+StatsEntry = Tuple[str, int, str]
+
 
 class CProfileCollector(Collector):
     """Collector that wraps execution with the built-in cProfile module."""
@@ -34,12 +40,14 @@ class CProfileCollector(Collector):
         timestamp to avoid collisions while keeping artifacts easy to locate.
         """
 
-        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        # time.strftime over gmtime stays in C; the datetime equivalent
+        # builds an intermediate object that is immediately discarded.
+        timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
         self._output_file = Path(self.output_dir) / f"cprofile_{timestamp}.pstats"
         return [sys.executable, "-m", "cProfile", "-o", str(self._output_file), *command]
 
     def start(self, pid: int) -> None:  # noqa: ARG002 - pid recorded for interface compliance
-        self._started_at = datetime.utcnow()
+        self._started_at = datetime.now(timezone.utc)
 
     def stop(self) -> ProfileArtifact:
         metrics = self._extract_metrics()
@@ -55,12 +63,24 @@ class CProfileCollector(Collector):
         )
 
     def _extract_metrics(self) -> Dict[str, Any]:
-        if not self._output_file or not self._output_file.exists():
-            return {"total_calls": 0.0, "total_time": 0.0, "top_functions": []}
-
-        stats = pstats.Stats(str(self._output_file))
-        total_calls = float(stats.total_calls)
-        total_time = float(stats.total_tt)
+        empty = {"total_calls": 0.0, "total_time": 0.0, "top_functions": []}
+        if not self._output_file:
+            return empty
+
+        # Load the raw marshal dict directly; pstats.Stats would rebuild
+        # subtotal/sort structures we never use when only total_calls,
+        # total_time, and a top-N slice are needed.
+        try:
+            with self._output_file.open("rb") as handle:
+                stats = marshal.load(handle)
+        except (FileNotFoundError, EOFError, ValueError):
+            return empty
+
+        total_calls = 0.0
+        total_time = 0.0
+        for values in stats.values():
+            total_calls += values[1]
+            total_time += values[2]
 
         top_functions = self._top_functions(stats)
         return {
@@ -69,18 +89,15 @@ class CProfileCollector(Collector):
             "top_functions": top_functions,
         }
 
-    def _top_functions(self, stats: pstats.Stats) -> List[Dict[str, Any]]:
-        sorted_entries = sorted(
-            stats.stats.items(), key=lambda entry: entry[1][3], reverse=True
-        )
-        top_entries = []
-        for (filename, line_no, func_name), values in sorted_entries[: self.top_n]:
-            _, call_count, _, cumulative_time, _ = values
-            top_entries.append(
-                {
-                    "function": f"{filename}:{line_no}:{func_name}",
-                    "call_count": float(call_count),
-                    "cumulative_time": float(cumulative_time),
-                }
-            )
-        return top_entries
+    def _top_functions(self, stats: Dict[StatsEntry, tuple]) -> List[Dict[str, Any]]:
+        # heapq.nlargest is O(N log K) and avoids materializing a fully
+        # sorted copy of the stats table just to keep the first top_n rows.
+        top = heapq.nlargest(self.top_n, stats.items(), key=lambda entry: entry[1][3])
+        return [
+            {
+                "function": f"{filename}:{line_no}:{func_name}",
+                "call_count": float(values[1]),
+                "cumulative_time": float(values[3]),
+            }
+            for (filename, line_no, func_name), values in top
+        ]
@@ -10,9 +10,10 @@ from __future__ import annotations
 
 import shutil
 import subprocess
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, List, Optional
 
 from ..models import ProfileArtifact
 from .base import Collector
@@ -32,6 +33,8 @@ class PySpyCollector(Collector):
         self._output_file: Optional[Path] = None
         self._disabled_reason: Optional[str] = None
         self._stderr: str = ""
+        self._stderr_chunks: List[str] = []
+        self._reader: Optional[threading.Thread] = None
 
     def start(self, pid: int) -> None:
         pyspy_path = shutil.which("py-spy")
@@ -39,7 +42,7 @@ class PySpyCollector(Collector):
             self._disabled_reason = "py-spy not available in PATH"
             return
 
-        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
         suffix = "svg" if self.flamegraph else "raw"
         self._output_file = Path(self.output_dir) / f"pyspy_{timestamp}.{suffix}"
 
@@ -58,10 +61,21 @@ class PySpyCollector(Collector):
 
         self._process = subprocess.Popen(  # noqa: S603 - external tool invocation is intentional
             command,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
         )
+        # Drain stderr in the background so stop() never blocks on a full
+        # pipe and can bound how long it waits for py-spy to exit.
+        self._reader = threading.Thread(
+            target=self._drain_stderr, args=(self._process.stderr,), daemon=True
+        )
+        self._reader.start()
+
+    def _drain_stderr(self, stream: IO[str]) -> None:
+        for line in stream:
+            self._stderr_chunks.append(line)
+        stream.close()
 
     def stop(self) -> ProfileArtifact:
         if self._disabled_reason:
@@ -73,10 +87,18 @@ class PySpyCollector(Collector):
                 raw_files=[],
             )
 
-        stderr_output = ""
         if self._process:
-            _, stderr_output = self._process.communicate()
-            self._stderr = stderr_output
+            # py-spy should exit on its own shortly after its recording
+            # window; terminate it if it overruns rather than blocking the
+            # rest of the pipeline indefinitely.
+            try:
+                self._process.wait(timeout=self.duration + 1.0)
+            except subprocess.TimeoutExpired:
+                self._process.terminate()
+                self._process.wait()
+            if self._reader:
+                self._reader.join()
+            self._stderr = "".join(self._stderr_chunks)
 
         metrics = {
             "duration_sec": float(self.duration),
@@ -0,0 +1,157 @@
+"""Unit tests for the environment bootstrap helper in tools/bootstrap.py.
+
+tools/ is not a package, so the module is imported via a sys.path entry.
+These tests only exercise the pure helpers; the network-facing install
+paths are covered by running the script itself.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+import bootstrap  # noqa: E402
+
+
+class ParsePinnedRequirementsTest(unittest.TestCase):
+    def _parse(self, text: str) -> list:
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as handle:
+            handle.write(text)
+            path = Path(handle.name)
+        try:
+            return bootstrap.parse_pinned_requirements(path)
+        finally:
+            path.unlink()
+
+    def test_plain_pins_with_comments_and_options(self) -> None:
+        pins = self._parse(
+            "# core deps\n"
+            "psutil==5.9.8\n"
+            "pyyaml==6.0.1  # parser\n"
+            "-e .\n"
+            "some-unpinned-package\n"
+        )
+        self.assertEqual(pins, ["psutil==5.9.8", "pyyaml==6.0.1"])
+
+    def test_hashed_lockfile_continuations(self) -> None:
+        """Trailing backslashes from --generate-hashes output must be stripped."""
+
+        pins = self._parse(
+            "pyyaml==6.0.3 \\\n"
+            "    --hash=sha256:deadbeef \\\n"
+            "    --hash=sha256:cafef00d\n"
+            "psutil==5.9.8 \\\n"
+            "    --hash=sha256:0123abcd\n"
+        )
+        self.assertEqual(pins, ["pyyaml==6.0.3", "psutil==5.9.8"])
+
+
+class RetargetClonedVenvTest(unittest.TestCase):
+    def test_template_paths_rewritten(self) -> None:
+        """Cloned activate scripts and shebangs must point at the clone."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            template = tmp_path / "template-venv"
+            clone = tmp_path / ".venv"
+            bin_dir = clone / "bin"
+            bin_dir.mkdir(parents=True)
+
+            (bin_dir / "activate").write_text(
+                f'VIRTUAL_ENV="{template}"\nexport VIRTUAL_ENV\n'
+            )
+            (bin_dir / "console-script").write_text(
+                f"#!{template}/bin/python\nimport sys\n"
+            )
+            (bin_dir / "python").write_bytes(b"\x7fELF\x02\x01binary")
+            (clone / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.11.7\n")
+
+            bootstrap.retarget_cloned_venv(clone, template)
+
+            self.assertEqual(
+                (bin_dir / "activate").read_text(),
+                f'VIRTUAL_ENV="{clone}"\nexport VIRTUAL_ENV\n',
+            )
+            self.assertEqual(
+                (bin_dir / "console-script").read_text(),
+                f"#!{clone}/bin/python\nimport sys\n",
+            )
+            # Binary files and files without the template path are untouched.
+            self.assertEqual(
+                (bin_dir / "python").read_bytes(), b"\x7fELF\x02\x01binary"
+            )
+            self.assertEqual(
+                (clone / "pyvenv.cfg").read_text(),
+                "home = /usr/bin\nversion = 3.11.7\n",
+            )
+
+
+def _write_tiny_wheel(directory: Path) -> Path:
+    """Build a minimal valid pure-Python wheel for offline install tests."""
+
+    wheel = directory / "tinypkg-1.0-py3-none-any.whl"
+    dist_info = "tinypkg-1.0.dist-info"
+    metadata = "Metadata-Version: 2.1\nName: tinypkg\nVersion: 1.0\n"
+    wheel_meta = (
+        "Wheel-Version: 1.0\n"
+        "Generator: test\n"
+        "Root-Is-Purelib: true\n"
+        "Tag: py3-none-any\n"
+    )
+    record = (
+        "tinypkg/__init__.py,,\n"
+        f"{dist_info}/METADATA,,\n"
+        f"{dist_info}/WHEEL,,\n"
+        f"{dist_info}/RECORD,,\n"
+    )
+    with zipfile.ZipFile(wheel, "w") as archive:
+        archive.writestr("tinypkg/__init__.py", "VALUE = 42\n")
+        archive.writestr(f"{dist_info}/METADATA", metadata)
+        archive.writestr(f"{dist_info}/WHEEL", wheel_meta)
+        archive.writestr(f"{dist_info}/RECORD", record)
+    return wheel
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec("pip") is not None, "pip not importable in-process"
+)
+class InProcessPipInstallTest(unittest.TestCase):
+    def test_install_lands_in_prefix(self) -> None:
+        """An in-process --prefix install must populate the target venv.
+
+        Regression test: without --ignore-installed the host pip resolves
+        requirements against the host site-packages and can report
+        "already satisfied" while leaving the venv empty.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            wheel = _write_tiny_wheel(tmp_path)
+            prefix = tmp_path / "venv"
+            exit_code = bootstrap.pip_install_in_process(
+                [
+                    "install",
+                    "-q",
+                    "--disable-pip-version-check",
+                    "--no-index",
+                    "--no-deps",
+                    "--prefix",
+                    str(prefix),
+                    "--ignore-installed",
+                    str(wheel),
+                ]
+            )
+            self.assertEqual(exit_code, 0)
+            installed = list(prefix.glob("lib/python*/site-packages/tinypkg/__init__.py"))
+            self.assertTrue(
+                installed, "tinypkg should be installed under the prefix site-packages"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
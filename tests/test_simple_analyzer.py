@@ -0,0 +1,94 @@
+"""Regression tests for the pattern-matching analyzer.
+
+The analyzer has two matching backends — a pure-Python scalar path and an
+optional NumPy vectorized path — that must agree on both the set of
+findings and their order. These tests run the same artifacts through both
+backends and compare the results.
+"""
+from __future__ import annotations
+
+import unittest
+
+import autoprofiler.analyzers.simple_analyzer as sa
+from autoprofiler.models import ProfileArtifact
+
+PATTERNS = [
+    {
+        "id": "high_cpu",
+        "condition": {"cpu_percent_avg": ">= 50"},
+        "meaning": "CPU-bound workload",
+    },
+    {
+        "id": "always_note",
+        "condition": {},
+        "meaning": "Unconditional advisory",
+    },
+    {
+        "id": "system_only",
+        "category": "system",
+        "condition": {"system.rss_bytes_max": "> 1000"},
+        "meaning": "Namespaced, category-scoped pattern",
+    },
+    {
+        "id": "cpu_only",
+        "category": "cpu",
+        "condition": {"total_time": "> 0.5"},
+        "meaning": "Applies to cpu artifacts only",
+    },
+    {
+        "id": "low_mem",
+        "condition": {"rss_bytes_max": "<= 5000"},
+        "meaning": "Memory fits comfortably",
+    },
+]
+
+ARTIFACTS = [
+    ProfileArtifact(
+        collector="PsutilCollector",
+        category="system",
+        timestamp="2026-01-01T00:00:00+00:00",
+        metrics={"cpu_percent_avg": 72.5, "rss_bytes_max": 2048.0, "status": "ok"},
+        raw_files=[],
+    ),
+    ProfileArtifact(
+        collector="CProfileCollector",
+        category="cpu",
+        timestamp="2026-01-01T00:00:01+00:00",
+        metrics={"total_time": 1.25, "total_calls": 10.0},
+        raw_files=[],
+    ),
+]
+
+
+def _finding_keys(findings):
+    return [(f.pattern_id, f.evidence) for f in findings]
+
+
+@unittest.skipUnless(sa._np is not None, "numpy not installed")
+class VectorizedScalarParityTest(unittest.TestCase):
+    def test_backends_agree_on_findings_and_order(self) -> None:
+        """Scalar and vectorized matching must yield identical ordered findings."""
+
+        vectorized = sa.PatternMatchingAnalyzer(PATTERNS).analyze(ARTIFACTS)
+
+        numpy_module = sa._np
+        sa._np = None
+        try:
+            scalar = sa.PatternMatchingAnalyzer(PATTERNS).analyze(ARTIFACTS)
+        finally:
+            sa._np = numpy_module
+
+        self.assertEqual(_finding_keys(vectorized), _finding_keys(scalar))
+
+    def test_vectorized_findings_follow_declaration_order(self) -> None:
+        """Unconditional patterns must not jump ahead of earlier conditional ones."""
+
+        findings = sa.PatternMatchingAnalyzer(PATTERNS).analyze(ARTIFACTS[:1])
+        pattern_ids = [finding.pattern_id for finding in findings]
+        self.assertEqual(
+            pattern_ids, ["high_cpu", "always_note", "system_only", "low_mem"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,19 +1,300 @@
+import hashlib
 import os
-import platform
+import shutil
 import subprocess
 import sys
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# sys.platform avoids platform.system(), which can import subprocess-heavy
+# machinery just to name the OS.
+IS_WIN = sys.platform.startswith("win")
 
-def run(cmd, cwd=None):
+# Every run() call appends the child's output here alongside echoing it,
+# so failed bootstraps leave a reviewable transcript.
+LOG_PATH = Path(__file__).resolve().parents[1] / ".bootstrap.log"
+
+
+def run(cmd, cwd=None, env=None):
     print(f"[cmd] {' '.join(cmd)}")
-    subprocess.check_call(cmd, cwd=cwd)
+    # Keep the kwargs minimal (no shell, no preexec_fn, no new session) so
+    # CPython picks its posix_spawn fast path instead of fork+exec;
+    # close_fds=False extends that to older glibc as well. Output is
+    # drained by a background thread so printing and logging overlap the
+    # child's work instead of serializing behind it.
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        close_fds=(os.name != "posix"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+    )
+
+    def drain(stream):
+        try:
+            with open(LOG_PATH, "a") as log:
+                for line in stream:
+                    sys.stdout.write(line)
+                    log.write(line)
+        except OSError:
+            for line in stream:
+                sys.stdout.write(line)
+
+    reader = threading.Thread(target=drain, args=(proc.stdout,))
+    reader.start()
+    returncode = proc.wait()
+    reader.join()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def uv_available(python):
+    """Return True when `python -m uv` works in the bootstrapping interpreter."""
+    try:
+        subprocess.check_call(
+            [python, "-m", "uv", "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+# Venv pips at or above this version are considered current enough that the
+# self-upgrade step is skipped.
+MIN_PIP = (23, 0)
+
+
+def venv_pip_version(venv_dir):
+    """Read the venv's pip version from its dist-info directory name.
+
+    Returns a (major, minor) tuple, or None when pip is absent or the
+    layout is unexpected. Scanning dist-info avoids spawning the venv
+    interpreter just to ask pip its own version.
+    """
+    patterns = (
+        "lib/python*/site-packages/pip-*.dist-info",
+        "Lib/site-packages/pip-*.dist-info",
+    )
+    for pattern in patterns:
+        for dist_info in venv_dir.glob(pattern):
+            version = dist_info.name[len("pip-") : -len(".dist-info")]
+            try:
+                return tuple(int(part) for part in version.split(".")[:2])
+            except ValueError:
+                return None
+    return None
+
+
+def parse_pinned_requirements(req_file):
+    """Return the `name==version` lines from requirements.txt.
+
+    Hashed lockfiles spread each requirement over continuation lines
+    (`pyyaml==6.0.3 \\` followed by indented `--hash=...` lines), so the
+    trailing backslash is stripped; the hash lines themselves start with
+    `-` and are skipped like any other option line.
+    """
+    pinned = []
+    for line in req_file.read_text().splitlines():
+        line = line.split("#", 1)[0].strip().rstrip("\\").strip()
+        if line and "==" in line and not line.startswith("-"):
+            pinned.append(line)
+    return pinned
+
+
+def prefetch_wheels(venv_python, pins, dest):
+    """Download pinned requirements' wheels concurrently into dest.
+
+    Concurrent installs into one venv race on shared dist-info, but
+    downloads never touch the venv, so only the network phase is
+    parallelized; the single resolver pass afterwards hits a warm local
+    wheel directory. Failures are ignored - the real install will report
+    them with full context.
+    """
+
+    def fetch(pin):
+        subprocess.run(
+            [
+                str(venv_python),
+                "-m",
+                "pip",
+                "download",
+                "-q",
+                "--no-deps",
+                "--dest",
+                str(dest),
+                pin,
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+
+    dest.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=min(4, len(pins))) as pool:
+        list(pool.map(fetch, pins))
+
+
+# CoW clone ioctl (Linux); makes file copies near-instant on btrfs/XFS.
+FICLONE = 0x40049409
+
+# A pre-provisioned venv copied instead of running `python -m venv`.
+TEMPLATE_VENV = Path.home() / ".cache" / "autoprofiler" / "template-venv"
+
+
+def reflink_copy(src, dst, *, follow_symlinks=True):
+    """Copy a file via CoW reflink where the filesystem supports it.
+
+    Falls back to a regular shutil.copy2 on non-Linux platforms or
+    filesystems without clone support (e.g. ext4, tmpfs).
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except OSError:
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def retarget_cloned_venv(venv_dir, template):
+    """Rewrite the template's absolute path inside a freshly cloned venv.
+
+    copytree preserves the template's path in the activate scripts
+    (VIRTUAL_ENV=...), console-script shebangs, and pyvenv.cfg, so an
+    unpatched clone would activate and execute against the template.
+    Only text files under bin/ (Scripts/ on Windows) plus pyvenv.cfg are
+    rewritten; binaries fail the decode and are left alone.
+    """
+    bin_dir = venv_dir / ("Scripts" if IS_WIN else "bin")
+    targets = [
+        path
+        for path in bin_dir.iterdir()
+        if path.is_file() and not path.is_symlink()
+    ]
+    targets.append(venv_dir / "pyvenv.cfg")
+    old, new = str(template), str(venv_dir)
+    for path in targets:
+        try:
+            text = path.read_text()
+        except (OSError, UnicodeDecodeError):
+            continue
+        if old in text:
+            path.write_text(text.replace(old, new))
+
+
+def venv_matches_interpreter(venv_dir):
+    """True when the venv's Python major.minor matches this interpreter."""
+    cfg = venv_dir / "pyvenv.cfg"
+    try:
+        for line in cfg.read_text().splitlines():
+            key, _, value = line.partition("=")
+            if key.strip() == "version":
+                parts = value.strip().split(".")[:2]
+                return tuple(int(p) for p in parts) == sys.version_info[:2]
+    except (OSError, ValueError):
+        return False
+    return False
+
+
+def pip_install_in_process(pip_args):
+    """Invoke pip inside this interpreter, returning its exit code.
+
+    Saves a full interpreter startup per pip call. Only safe when the
+    bootstrapping interpreter's ABI matches the venv (checked by the
+    caller) and pip is importable here; the caller falls back to a
+    subprocess otherwise.
+    """
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        return None
+    print(f"[cmd] (in-process) pip {' '.join(pip_args)}")
+    return pip_main(list(pip_args))
+
+
+def restore_venv_snapshot(tarball, project_root):
+    """Extract a cached venv tarball into the project root."""
+    print(f"[info] restoring venv snapshot {tarball.name}")
+    with tarfile.open(tarball, "r:gz") as tar:
+        tar.extractall(project_root)
+
+
+def save_venv_snapshot(tarball, project_root):
+    """Snapshot .venv into a tarball keyed by the requirements hash.
+
+    gzip keeps this dependency-free; the write goes through a temp file so
+    an interrupted snapshot never leaves a truncated cache entry.
+    """
+    tarball.parent.mkdir(parents=True, exist_ok=True)
+    partial = tarball.with_suffix(".partial")
+    with tarfile.open(partial, "w:gz") as tar:
+        tar.add(project_root / ".venv", arcname=".venv")
+    partial.replace(tarball)
+    print(f"[info] venv snapshot saved to {tarball}")
+
+
+def resolve_requirements(python, project_root, req_file):
+    """Pre-resolve requirements.txt into a hashed requirements.lock.
+
+    Uses pip-tools' backtracking resolver once, up front, so every later
+    bootstrap installs a flat pinned list instead of re-running (and
+    potentially backtracking through) dependency resolution.
+    """
+    lock_file = project_root / "requirements.lock"
+    run([python, "-m", "pip", "install", "--disable-pip-version-check", "pip-tools"])
+    run(
+        [
+            python,
+            "-m",
+            "piptools",
+            "compile",
+            "--resolver=backtracking",
+            "--generate-hashes",
+            str(req_file),
+            "-o",
+            str(lock_file),
+        ]
+    )
+    print(f"[ok] resolved lockfile written to {lock_file}")
+
+
+def lock_requirements(python, project_root, req_file):
+    """Compile requirements.txt into requirements.lock with uv."""
+    lock_file = project_root / "requirements.lock"
+    run(
+        [
+            python,
+            "-m",
+            "uv",
+            "pip",
+            "compile",
+            str(req_file),
+            "-o",
+            str(lock_file),
+        ]
+    )
+    print(f"[ok] lockfile written to {lock_file}")
 
 
 def main():
     project_root = Path(__file__).resolve().parents[1]  # tests/Autoprof
     venv_dir = project_root / ".venv"
     req_file = project_root / "requirements.txt"
+    lock_file = project_root / "requirements.lock"
 
     if not req_file.exists():
         print(f"[error] requirements.txt not found at: {req_file}")
@@ -21,31 +302,201 @@ def main():
 
     python = sys.executable
 
-    # 1) create venv if not exists
+    if "lock" in sys.argv[1:]:
+        if not uv_available(python):
+            print("[error] lock mode requires uv (python -m pip install uv)")
+            sys.exit(1)
+        lock_requirements(python, project_root, req_file)
+        return
+
+    if "--resolve" in sys.argv[1:]:
+        resolve_requirements(python, project_root, req_file)
+        return
+
+    # A committed lockfile is already fully resolved, so installing from it
+    # with --no-deps skips pip's backtracking resolver entirely.
+    use_lock = lock_file.exists()
+    source_file = lock_file if use_lock else req_file
+    if use_lock:
+        print(f"[info] installing from lockfile {lock_file.name}")
+
+    req_hash = hashlib.blake2b(source_file.read_bytes()).hexdigest()
+    venv_tarball = project_root / ".venv-cache" / f"venv-{req_hash[:16]}.tgz"
+
+    # Whole-run memo: when requirements, interpreter, and platform are all
+    # unchanged since the last successful bootstrap, there is nothing to do.
+    bootstrap_key = hashlib.blake2b(
+        source_file.read_bytes() + sys.version.encode() + sys.platform.encode()
+    ).hexdigest()[:16]
+    sentinel = venv_dir / f".bootstrap-ok-{bootstrap_key}"
+    if sentinel.exists():
+        print("[info] cached bootstrap, nothing to do")
+        return
+
+    # uv resolves and installs in parallel with a shared global cache, which
+    # is much faster than pip; --no-uv forces the plain pip path. Probed
+    # only after the sentinel check so warm reruns never pay the
+    # interpreter startup of `python -m uv --version`.
+    use_uv = "--no-uv" not in sys.argv and uv_available(python)
+
+    # 1) create venv if not exists (a snapshot for this exact requirements
+    # hash skips venv creation and the install entirely)
+    if not venv_dir.exists() and venv_tarball.exists():
+        restore_venv_snapshot(venv_tarball, project_root)
     if not venv_dir.exists():
         print(f"[info] Creating venv at {venv_dir}")
-        run([python, "-m", "venv", str(venv_dir)])
+        if TEMPLATE_VENV.is_dir() and venv_matches_interpreter(TEMPLATE_VENV):
+            # Cloning a pre-provisioned template venv (reflinked where the
+            # filesystem supports it) is near-instant vs. python -m venv.
+            print(f"[info] cloning template venv from {TEMPLATE_VENV}")
+            shutil.copytree(
+                TEMPLATE_VENV, venv_dir, symlinks=True, copy_function=reflink_copy
+            )
+            retarget_cloned_venv(venv_dir, TEMPLATE_VENV)
+        elif use_uv:
+            run([python, "-m", "uv", "venv", str(venv_dir)])
+        else:
+            # --without-pip skips the implicit ensurepip run (1-3s); pip is
+            # bootstrapped below only when actually needed.
+            run([python, "-m", "venv", "--without-pip", str(venv_dir)])
     else:
         print(f"[info] venv already exists at {venv_dir}")
 
     # 2) locate venv python
-    if platform.system().lower().startswith("win"):
+    if IS_WIN:
         venv_python = venv_dir / "Scripts" / "python.exe"
         venv_pip = venv_dir / "Scripts" / "pip.exe"
     else:
         venv_python = venv_dir / "bin" / "python"
         venv_pip = venv_dir / "bin" / "pip"
 
-    if not venv_python.exists():
+    try:
+        venv_python.stat()
+    except FileNotFoundError:
         print(f"[error] venv python not found at: {venv_python}")
         sys.exit(1)
 
-    # 3) upgrade pip + install requirements
-    run([str(venv_python), "-m", "pip", "install", "-U", "pip"])
-    run([str(venv_pip), "install", "-r", str(req_file)])
+    # Short-circuit when the venv was already provisioned for this exact
+    # requirements source; warm reruns become a near-no-op.
+    hash_file = venv_dir / ".bootstrap_hash"
+    if hash_file.exists() and hash_file.read_text().strip() == req_hash:
+        print("[info] requirements unchanged, skipping install (cache hit)")
+        install_needed = False
+    else:
+        install_needed = True
+
+    # uv installs into the venv from outside, so pip is only bootstrapped
+    # on the fallback path, and only if the venv does not have it yet.
+    if install_needed and not use_uv and not venv_pip.exists():
+        run([str(venv_python), "-m", "ensurepip", "--default-pip"])
+
+    # 3) install requirements (uv needs no pip self-upgrade)
+    if not install_needed:
+        pass
+    elif use_uv:
+        if use_lock:
+            # uv pip sync makes the venv exactly match the lockfile.
+            uv_cmd = [python, "-m", "uv", "pip", "sync", "--python", str(venv_python), str(lock_file)]
+        else:
+            uv_cmd = [python, "-m", "uv", "pip", "install", "--python", str(venv_python), "-r", str(req_file)]
+        run(uv_cmd)
+    else:
+        # One pip invocation upgrades pip and installs the requirements,
+        # saving a full interpreter + resolver startup versus two calls.
+        # Recent pip downloads wheels in parallel when asked; older versions
+        # ignore the env var and may reject fast-deps, so retry without it.
+        pip_env = os.environ.copy()
+        pip_env["PIP_PARALLEL_DOWNLOADS"] = str(min(8, os.cpu_count() or 1))
+        # Prefer wheels over sdists and keep downloads in a project-local
+        # cache that CI can mount as a cache volume, so fresh venvs reuse
+        # earlier downloads instead of hitting the index again.
+        pip_env["PIP_PREFER_BINARY"] = "1"
+        cache_dir = project_root / ".pip-cache"
+        pins = parse_pinned_requirements(source_file)
+        # Keep prefetched wheels next to the pip cache, not inside the
+        # venv, so they are never tarred into .venv-cache snapshots.
+        wheel_dir = cache_dir / "wheel-prefetch"
+        if len(pins) > 1:
+            print(f"[info] prefetching {len(pins)} pinned wheels in parallel")
+            prefetch_wheels(venv_python, pins, wheel_dir)
+        pip_cmd = [
+            str(venv_python),
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--cache-dir",
+            str(cache_dir),
+        ]
+        pip_version = venv_pip_version(venv_dir)
+        pip_current = pip_version is not None and pip_version >= MIN_PIP
+        # Hashed lockfiles (--resolve mode) additionally pin artifact
+        # content, so enforce the hashes during install.
+        require_hashes = use_lock and "--hash=" in lock_file.read_text()
+        if pip_current:
+            print(f"[info] venv pip {'.'.join(map(str, pip_version))} is current, skipping upgrade")
+        elif require_hashes:
+            # pip refuses to mix the unhashed 'pip' requirement with
+            # --require-hashes in one command, so hash-checked installs
+            # upgrade pip in a separate step instead of fusing the two.
+            run(pip_cmd + ["-U", "pip"], env=pip_env)
+        else:
+            pip_cmd += ["-U", "pip"]
+        pip_cmd += ["-r", str(source_file)]
+        if use_lock:
+            pip_cmd.append("--no-deps")
+            if require_hashes:
+                pip_cmd.append("--require-hashes")
+        if wheel_dir.is_dir():
+            pip_cmd += ["--find-links", str(wheel_dir)]
+
+        # Opt-in: drive pip from this interpreter with --prefix aimed at
+        # the venv, skipping one interpreter startup. Requires a matching
+        # ABI and the host pip; anything else falls back to the subprocess.
+        in_process = (
+            "--in-process-pip" in sys.argv
+            and "-U" not in pip_cmd
+            and venv_matches_interpreter(venv_dir)
+        )
+        installed = False
+        if in_process:
+            # --ignore-installed is required here: the host pip resolves
+            # "already satisfied" against the host site-packages, so without
+            # it requirements present on the host would silently never be
+            # copied into the venv.
+            pip_args = pip_cmd[3:] + ["--prefix", str(venv_dir), "--ignore-installed"]
+            exit_code = pip_install_in_process(pip_args)
+            if exit_code == 0:
+                installed = True
+            elif exit_code is not None:
+                sys.exit(exit_code)
+        if not installed:
+            # First attempt refuses sdists outright (--only-binary) so a
+            # missing wheel can never trigger a slow source build silently;
+            # the retry drops the strict flags for packages that ship no
+            # wheel and for pips predating fast-deps.
+            try:
+                run(
+                    pip_cmd + ["--only-binary=:all:", "--use-feature=fast-deps"],
+                    env=pip_env,
+                )
+            except subprocess.CalledProcessError:
+                print("[warn] retrying without --only-binary/fast-deps")
+                run(pip_cmd, env=pip_env)
+
+    if install_needed:
+        hash_file.write_text(req_hash)
+        if not venv_tarball.exists():
+            save_venv_snapshot(venv_tarball, project_root)
+
+    # Record the successful run; stale sentinels from other inputs are
+    # dropped so the venv holds exactly one valid marker.
+    for stale in venv_dir.glob(".bootstrap-ok-*"):
+        stale.unlink()
+    sentinel.touch()
 
     print("\n[ok] Environment ready.")
-    if platform.system().lower().startswith("win"):
+    if IS_WIN:
         print(f"Activate: {venv_dir}\\Scripts\\activate")
     else:
         print(f"Activate: source {venv_dir}/bin/activate")